@@ -0,0 +1,26 @@
+from typing import Any, Dict, Iterable
+
+
+def get_slots(obj: Any, exclude: Iterable[str] = ()) -> Dict[str, Any]:
+	"""
+	Get the values of the slots declared across an object's class hierarchy.
+
+	Slots that are unset, excluded, or are __dict__/__weakref__ are
+	skipped.
+
+	:param obj: Any, The object whose slots to read.
+	:param exclude: Iterable[str], The slot names to leave out.
+	:return: Dict[str, Any]
+
+	"""
+
+	skip = {"__dict__", "__weakref__"}.union(exclude)
+	slots = {}
+	for cls in type(obj).__mro__:
+		names = cls.__dict__.get("__slots__", ())
+		if isinstance(names, str):
+			names = (names,)
+		for name in names:
+			if name not in skip and hasattr(obj, name):
+				slots[name] = getattr(obj, name)
+	return slots
\ No newline at end of file
@@ -1,4 +1,6 @@
 import abc
+from typing import Any, Tuple
+from generic.objects import get_slots
 
 
 class Constraint(abc.ABC):
@@ -7,11 +9,17 @@ class Constraint(abc.ABC):
 
 	A generic value constraint.
 
+	Constraints are treated as immutable once constructed, so their hash
+	is computed once and cached. Subclasses that compare by value
+	override _compute_hash and _eq_slow rather than __hash__ and __eq__.
+
 	Attributes:
 
 
 	"""
 
+	__slots__ = ("_hash",)
+
 	def __init__(self) -> None:
 		"""
 		Generic Constraint Constructor
@@ -20,4 +28,89 @@ class Constraint(abc.ABC):
 
 		"""
 
-		pass
\ No newline at end of file
+		self._hash = None
+
+	def __hash__(self) -> int:
+		"""
+		Get the (cached) hash of the constraint.
+
+		The cache is read defensively, since subclasses need not call the
+		base constructor.
+
+		:return: int
+
+		"""
+
+		h = getattr(self, "_hash", None)
+		if h is None:
+			h = self._compute_hash()
+			self._hash = h
+		return h
+
+	def __eq__(self, other: object) -> Any:
+		"""
+		Check whether the constraint is equal to another.
+
+		:param other: object, The object to compare against.
+		:return: bool, or NotImplemented for objects of another type
+
+		"""
+
+		if self is other:
+			return True
+		if type(self) is not type(other):
+			return NotImplemented
+		return hash(self) == hash(other) and self._eq_slow(other)
+
+	def __getstate__(self) -> Tuple[Any, dict]:
+		"""
+		Get the picklable state of the constraint.
+
+		Returns the instance dict (or None) and the slots declared across
+		the class hierarchy, in the form pickle and copy restore by
+		default. The cached hash is not carried over, since hashes of str
+		and bytes values differ between interpreter processes.
+
+		:return: Tuple[Any, dict]
+
+		"""
+
+		return getattr(self, "__dict__", None) or None, get_slots(self, exclude=("_hash",))
+
+	def _compute_hash(self) -> int:
+		"""
+		Compute the hash of the constraint.
+
+		Defaults to identity; override alongside _eq_slow to compare
+		constraints by value.
+
+		:return: int
+
+		"""
+
+		return object.__hash__(self)
+
+	def _eq_slow(self, other: "Constraint") -> bool:
+		"""
+		Compare against another constraint of the same type and hash.
+
+		:param other: Constraint, The constraint to compare against.
+		:return: bool
+
+		"""
+
+		return False
+
+	@abc.abstractmethod
+	def evaluate(self, value: Any) -> None:
+		"""
+		Evaluate the value against the constraint.
+
+		:param value: Any, The value to be checked.
+		:return: None
+
+		:raises: ValueError
+
+		"""
+
+		raise NotImplementedError()
\ No newline at end of file
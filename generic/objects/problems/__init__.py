@@ -19,6 +19,8 @@ class Problem(abc.ABC):
 
 	"""
 
+	__slots__ = ("_id", "_description", "_variables", "_link")
+
 	def __init__(self, id: int, description: str, variables: List[Variable]) -> None:
 		"""
 		Generic Problem Constructor
@@ -69,6 +71,7 @@ class Problem(abc.ABC):
 		"""
 
 		self._id = id
+		self._link = "https://projecteuler.net/problem={}".format(id)
 
 	@property
 	def description(self) -> str:
@@ -121,8 +124,10 @@ class Problem(abc.ABC):
 		"""
 		Get the link to the official problem on the Project Euler site.
 
+		The link is built when the id is set.
+
 		:return: str
 
 		"""
 
-		return "https://projecteuler.net/problem={}".format(self.id)
+		return self._link
@@ -12,6 +12,8 @@ class Solution(abc.ABC):
 
 	"""
 
+	__slots__ = ()
+
 	def __init__(self) -> None:
 		"""
 		Generic Solution Constructor
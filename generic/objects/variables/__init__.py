@@ -1,8 +1,73 @@
 import abc
-from typing import Any, List
+import itertools
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from generic.objects import get_slots
 from generic.objects.constraints import Constraint
 
 
+_IMMUTABLE_TYPES = frozenset((int, float, complex, bool, str, bytes, type(None)))
+_MAX_INLINE_CONSTRAINTS = 8
+_MAX_SHARED_CHECKS = 256
+_SHARED_CHECKS: Dict[Tuple[int, ...], Tuple[Tuple[Constraint, ...], Callable[[Any], None]]] = {}
+
+
+def _build_check(constraints: Tuple[Constraint, ...]) -> Callable[[Any], None]:
+	"""
+	Build the check for a tuple of constraints.
+
+	Small constraint tuples are compiled into a straight-line function
+	that calls each bound evaluate method in turn, passed in as default
+	arguments so they load as locals; larger ones fall back to a loop.
+
+	:param constraints: Tuple[Constraint, ...], The constraints to check.
+	:return: Callable[[Any], None]
+
+	"""
+
+	evaluators = tuple(c.evaluate for c in constraints)
+
+	if len(evaluators) > _MAX_INLINE_CONSTRAINTS:
+		def check(value: Any, _evs: Tuple[Callable[[Any], None], ...] = evaluators) -> None:
+			for evaluate in _evs:
+				evaluate(value)
+
+		return check
+
+	names = ["_e{}".format(i) for i in range(len(evaluators))]
+	namespace = dict(zip(names, evaluators))
+	params = "".join(", {0}={0}".format(name) for name in names)
+	body = "".join("\t{}(value)\n".format(name) for name in names)
+	source = "def check(value{}):\n{}".format(params, body or "\tpass\n")
+	exec(compile(source, "<variable check>", "exec"), namespace)
+	return namespace["check"]
+
+
+def _compile_check(constraints: Tuple[Constraint, ...]) -> Callable[[Any], None]:
+	"""
+	Get the shared check for a tuple of constraints.
+
+	Variables constrained by the same constraint instances, in the same
+	order, share a single check. The cache is keyed on the ids of the
+	instances rather than on equality, so a check only ever calls the
+	exact objects it was built from; each entry holds its constraints so
+	that their ids cannot be reused while it is cached. Past the cache
+	size the oldest entry is evicted.
+
+	:param constraints: Tuple[Constraint, ...], The constraints to check.
+	:return: Callable[[Any], None]
+
+	"""
+
+	key = tuple(map(id, constraints))
+	entry = _SHARED_CHECKS.get(key)
+	if entry is None:
+		if len(_SHARED_CHECKS) >= _MAX_SHARED_CHECKS:
+			del _SHARED_CHECKS[next(iter(_SHARED_CHECKS))]
+		entry = (constraints, _build_check(constraints))
+		_SHARED_CHECKS[key] = entry
+	return entry[1]
+
+
 class Variable(abc.ABC):
 	"""
 	Variable Class
@@ -13,11 +78,13 @@ class Variable(abc.ABC):
 	Attributes:
 		name (:obj:`str`): The name of the variable.
 		description (:obj:`str`): The description of the variable.
-		constraints (:obj:`List[Constraint]`): The list of constraints to
+		constraints (:obj:`Tuple[Constraint, ...]`): The constraints to
 			apply to any binding for this variable.
 
 	"""
 
+	__slots__ = ("_name", "_description", "_constraints", "_check", "_generation")
+
 	def __init__(self, name: str, description: str, constraints: List[Constraint]) -> None:
 		"""
 		Generic Variable Constructor
@@ -81,19 +148,102 @@ class Variable(abc.ABC):
 		self._description = description
 
 	@property
-	def constraints(self) -> List[Constraint]:
+	def constraints(self) -> Tuple[Constraint, ...]:
 		"""
 		Get the constraints for the variable.
 
-		Todo:
-			- Add methods for removing/adding constraints
-
-		:return: List[Constraint]
+		:return: Tuple[Constraint, ...]
 
 		"""
 
 		return self._constraints
 
+	@constraints.setter
+	def constraints(self, constraints: Iterable[Constraint]) -> None:
+		"""
+		Set the constraints for the variable.
+
+		Duplicate constraints are dropped, keeping the first occurrence.
+
+		:param constraints: Iterable[Constraint], The constraints to apply
+			to any binding for this variable.
+		:return: None
+
+		"""
+
+		self._constraints = tuple(dict.fromkeys(constraints))
+		self._rebuild_check()
+
+	def constrain(self, constraints: Iterable[Constraint]) -> None:
+		"""
+		Add constraints to the variable.
+
+		:param constraints: Iterable[Constraint], The constraints to add.
+		:return: None
+
+		"""
+
+		self.constraints = itertools.chain(self._constraints, constraints)
+
+	def unconstrain(self, constraints: Iterable[Constraint]) -> None:
+		"""
+		Remove constraints from the variable.
+
+		:param constraints: Iterable[Constraint], The constraints to remove.
+		:return: None
+
+		"""
+
+		if not isinstance(constraints, (set, frozenset)):
+			constraints = set(constraints)
+		self.constraints = [c for c in self._constraints if c not in constraints]
+
+	def _rebuild_check(self) -> None:
+		"""
+		Rebuild the fused check applied to any value bound to the variable.
+
+		The check is built once per change to the constraints so that a
+		binding is validated with a single call rather than a walk over
+		the constraints. The generation is bumped so bindings know to
+		revalidate.
+
+		:return: None
+
+		"""
+
+		self._check = _compile_check(self._constraints)
+		self._generation = getattr(self, "_generation", -1) + 1
+
+	def __getstate__(self) -> dict:
+		"""
+		Get the picklable state of the variable.
+
+		Slots declared anywhere in the class hierarchy are collected along
+		with the instance dict, if any. The fused check is a closure and
+		cannot be pickled, so it is dropped here and looked up again on
+		unpickling.
+
+		:return: dict
+
+		"""
+
+		state = dict(getattr(self, "__dict__", {}))
+		state.update(get_slots(self, exclude=("_check",)))
+		return state
+
+	def __setstate__(self, state: dict) -> None:
+		"""
+		Restore the variable from its pickled state.
+
+		:param state: dict, The state returned by __getstate__.
+		:return: None
+
+		"""
+
+		for name, value in state.items():
+			setattr(self, name, value)
+		self._rebuild_check()
+
 
 class Binding(object):
 	"""
@@ -107,6 +257,8 @@ class Binding(object):
 
 	"""
 
+	__slots__ = ("_variable", "_value", "_generation")
+
 	def __init__(self, variable: Variable, value: Any) -> None:
 		"""
 		Variable Binding Constructor
@@ -121,10 +273,54 @@ class Binding(object):
 		self.variable = variable
 		self.rebind(value=value)
 
+	@property
+	def variable(self) -> Variable:
+		"""
+		Get the variable to which the value is bound.
+
+		This is the live variable, not a copy; constraining it affects
+		every binding that shares it.
+
+		:return: Variable
+
+		"""
+
+		return self._variable
+
+	@variable.setter
+	def variable(self, variable: Variable) -> None:
+		"""
+		Set the variable to which the value is bound.
+
+		:param variable: Variable, The variable to which the value is bound.
+		:return: None
+
+		"""
+
+		self._variable = variable
+		self._generation = -1
+
+	@property
+	def value(self) -> Any:
+		"""
+		Get the value bound to the variable.
+
+		:return: Any
+
+		"""
+
+		return self._value
+
 	def rebind(self, value: Any) -> None:
 		"""
 		Rebind with the new value.
 
+		Rebinding the value already held skips validation if the value is
+		of an immutable scalar type (numbers, str, bytes, None) and the
+		variable's constraints have not changed since it was last
+		validated. Any other value, including containers that may hold
+		objects mutated in place, is always revalidated.
+
 		:param value: Any, The value to be bound to the var.
 		:return: None
 
@@ -132,4 +328,13 @@ class Binding(object):
 
 		"""
 
-		pass
+		variable = self._variable
+		if (
+			value is self._value
+			and self._generation == variable._generation
+			and value.__class__ in _IMMUTABLE_TYPES
+		):
+			return
+		variable._check(value)
+		self._value = value
+		self._generation = variable._generation
\ No newline at end of file
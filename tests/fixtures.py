@@ -0,0 +1,75 @@
+from typing import Any
+from generic.objects.constraints import Constraint
+from generic.objects.problems import Problem
+from generic.objects.solutions import Solution
+from generic.objects.variables import Variable
+
+
+class Below(Constraint):
+	__slots__ = ("n",)
+
+	def __init__(self, n: int) -> None:
+		super().__init__()
+		self.n = n
+
+	def evaluate(self, value: Any) -> None:
+		if value >= self.n:
+			raise ValueError("{} is not below {}".format(value, self.n))
+
+
+class Lt(Constraint):
+	__slots__ = ("n",)
+
+	def __init__(self, n: int) -> None:
+		super().__init__()
+		self.n = n
+
+	def evaluate(self, value: Any) -> None:
+		if value >= self.n:
+			raise ValueError("{} is not less than {}".format(value, self.n))
+
+	def _compute_hash(self) -> int:
+		return hash(("lt", self.n))
+
+	def _eq_slow(self, other: "Lt") -> bool:
+		return self.n == other.n
+
+
+class Positive(Constraint):
+	"""A constraint that never calls the base constructor."""
+
+	def __init__(self) -> None:
+		self.strict = True
+
+	def evaluate(self, value: Any) -> None:
+		if value <= 0:
+			raise ValueError("{} is not positive".format(value))
+
+
+class Counting(Constraint):
+	__slots__ = ("calls",)
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.calls = 0
+
+	def evaluate(self, value: Any) -> None:
+		self.calls += 1
+
+
+class Var(Variable):
+	pass
+
+
+class SlottedVar(Variable):
+	__slots__ = ("_unit",)
+
+	def __init__(self, name: str, unit: str) -> None:
+		super().__init__(name, "", [Below(10)])
+		self._unit = unit
+
+
+class Prob(Problem):
+
+	def solve(self) -> Solution:
+		raise NotImplementedError()
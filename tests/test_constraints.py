@@ -0,0 +1,78 @@
+import copy
+import pickle
+import unittest
+from tests.fixtures import Lt, Positive, Var
+
+
+class TestConstraintIdentity(unittest.TestCase):
+
+	def test_default_equality_is_identity(self) -> None:
+		c = Positive()
+		self.assertEqual(c, c)
+		self.assertNotEqual(c, Positive())
+		self.assertEqual(hash(c), hash(c))
+
+	def test_subclass_without_base_constructor_is_hashable(self) -> None:
+		c = Positive()
+		var = Var("n", "d", [c, c])
+		self.assertEqual(var.constraints, (c,))
+
+	def test_other_types_are_not_equal(self) -> None:
+		self.assertIs(Lt(5).__eq__(Positive()), NotImplemented)
+		self.assertIs(Lt(5).__eq__(5), NotImplemented)
+		self.assertNotEqual(Lt(5), Positive())
+
+
+class TestConstraintValueHash(unittest.TestCase):
+
+	def test_equal_values_are_equal(self) -> None:
+		self.assertEqual(Lt(5), Lt(5))
+		self.assertEqual(hash(Lt(5)), hash(Lt(5)))
+		self.assertNotEqual(Lt(5), Lt(6))
+
+	def test_hash_is_cached(self) -> None:
+		c = Lt(5)
+		h = hash(c)
+		c.n = 6
+		self.assertEqual(hash(c), h)
+
+	def test_equal_values_are_deduplicated(self) -> None:
+		a = Lt(5)
+		self.assertEqual(Var("n", "d", [a, Lt(5)]).constraints, (a,))
+
+
+class TestConstraintPickle(unittest.TestCase):
+
+	def test_dict_subclass_round_trips(self) -> None:
+		c = pickle.loads(pickle.dumps(Positive()))
+		self.assertTrue(c.strict)
+		with self.assertRaises(ValueError):
+			c.evaluate(0)
+
+	def test_slotted_subclass_round_trips(self) -> None:
+		for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+			c = pickle.loads(pickle.dumps(Lt(5), protocol))
+			self.assertEqual(c.n, 5)
+			self.assertEqual(c, Lt(5))
+
+	def test_cached_hash_is_not_pickled(self) -> None:
+		c = Lt(5)
+		hash(c)
+		self.assertIsNone(getattr(pickle.loads(pickle.dumps(c)), "_hash", None))
+
+	def test_identity_hash_is_not_carried_over(self) -> None:
+		c = Positive()
+		hash(c)
+		d = pickle.loads(pickle.dumps(c))
+		self.assertNotEqual(c, d)
+		self.assertEqual(hash(d), hash(d))
+
+	def test_copy(self) -> None:
+		c = Lt(5)
+		hash(c)
+		self.assertEqual(copy.copy(c), c)
+		self.assertEqual(copy.deepcopy(c).n, 5)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,26 @@
+import pickle
+import unittest
+from tests.fixtures import Below, Prob, Var
+
+
+class TestProblemLink(unittest.TestCase):
+
+	def test_link(self) -> None:
+		problem = Prob(7, "d", [])
+		self.assertEqual(problem.link, "https://projecteuler.net/problem=7")
+
+	def test_link_follows_id(self) -> None:
+		problem = Prob(7, "d", [])
+		problem.id = 8
+		self.assertEqual(problem.link, "https://projecteuler.net/problem=8")
+
+	def test_link_survives_pickle(self) -> None:
+		problem = pickle.loads(pickle.dumps(Prob(7, "d", [Var("n", "d", [Below(10)])])))
+		self.assertEqual(problem.id, 7)
+		self.assertEqual(problem.link, "https://projecteuler.net/problem=7")
+		problem.id = 9
+		self.assertEqual(problem.link, "https://projecteuler.net/problem=9")
+
+
+if __name__ == "__main__":
+	unittest.main()
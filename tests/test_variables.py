@@ -0,0 +1,184 @@
+import pickle
+import unittest
+from typing import Any
+from generic.objects import variables
+from generic.objects.variables import Binding
+from tests.fixtures import Below, Counting, Lt, SlottedVar, Var
+
+
+class Box(object):
+
+	def __init__(self, v: int) -> None:
+		self.v = v
+
+
+class BoxesBelow(Below):
+	__slots__ = ()
+
+	def evaluate(self, value: Any) -> None:
+		for box in value:
+			super().evaluate(box.v)
+
+
+class ShorterThan(Below):
+	__slots__ = ()
+
+	def evaluate(self, value: Any) -> None:
+		super().evaluate(len(value))
+
+
+class TestVariablePickle(unittest.TestCase):
+
+	def test_round_trip_keeps_constraints(self) -> None:
+		var = pickle.loads(pickle.dumps(Var("n", "d", [Below(10)])))
+		self.assertEqual(var.name, "n")
+		self.assertEqual(len(var.constraints), 1)
+		with self.assertRaises(ValueError):
+			Binding(var, 10)
+
+	def test_round_trip_keeps_subclass_slots(self) -> None:
+		var = pickle.loads(pickle.dumps(SlottedVar("n", "m")))
+		self.assertEqual(var._unit, "m")
+		self.assertEqual(var.name, "n")
+		Binding(var, 5)
+
+	def test_round_trip_keeps_instance_dict(self) -> None:
+		var = Var("n", "d", [])
+		var.extra = 1
+		self.assertEqual(pickle.loads(pickle.dumps(var)).extra, 1)
+
+
+class TestVariableConstraints(unittest.TestCase):
+
+	def test_duplicates_are_dropped_in_order(self) -> None:
+		a, b, c = Below(10), Below(20), Below(30)
+		var = Var("n", "d", [a, b, a])
+		var.constrain([c, b, a, c])
+		self.assertEqual(var.constraints, (a, b, c))
+
+	def test_constrain_accepts_any_iterable(self) -> None:
+		a, b = Below(10), Below(20)
+		var = Var("n", "d", [a])
+		var.constrain(c for c in (b, a, b))
+		self.assertEqual(var.constraints, (a, b))
+
+	def test_unconstrain_accepts_any_collection(self) -> None:
+		a, b, c = Below(10), Below(20), Below(30)
+		for removed in ({a, c}, frozenset((a, c)), [a, c]):
+			var = Var("n", "d", [a, b, c])
+			var.unconstrain(removed)
+			self.assertEqual(var.constraints, (b,))
+
+	def test_unconstrain_missing_is_ignored(self) -> None:
+		a = Below(10)
+		var = Var("n", "d", [a])
+		var.unconstrain([Below(10)])
+		self.assertEqual(var.constraints, (a,))
+
+	def test_unconstrain_removes_equal_constraint(self) -> None:
+		var = Var("n", "d", [Lt(5), Below(20)])
+		var.unconstrain([Lt(5)])
+		self.assertEqual(len(var.constraints), 1)
+		self.assertEqual(Binding(var, 10).value, 10)
+
+	def test_removed_constraint_no_longer_fires(self) -> None:
+		below = Below(10)
+		var = Var("n", "d", [below])
+		with self.assertRaises(ValueError):
+			Binding(var, 50)
+		var.unconstrain([below])
+		self.assertEqual(Binding(var, 50).value, 50)
+
+	def test_added_constraint_fires(self) -> None:
+		var = Var("n", "d", [])
+		Binding(var, 50)
+		var.constrain([Below(10)])
+		with self.assertRaises(ValueError):
+			Binding(var, 50)
+
+
+class TestVariableCheck(unittest.TestCase):
+
+	def test_unconstrained_accepts_anything(self) -> None:
+		Binding(Var("n", "d", []), object())
+
+	def test_checks_every_constraint(self) -> None:
+		var = Var("n", "d", [Below(10), Below(5)])
+		Binding(var, 4)
+		with self.assertRaises(ValueError):
+			Binding(var, 7)
+
+	def test_many_constraints_fall_back_to_loop(self) -> None:
+		var = Var("n", "d", [Below(100 + i) for i in range(12)] + [Below(10)])
+		Binding(var, 9)
+		with self.assertRaises(ValueError):
+			Binding(var, 10)
+
+	def test_constraints_fire_in_order(self) -> None:
+		for count in (2, variables._MAX_INLINE_CONSTRAINTS + 2):
+			var = Var("n", "d", [Below(10 - i) for i in range(count)])
+			with self.assertRaisesRegex(ValueError, "below 10$"):
+				Binding(var, 50)
+
+	def test_same_constraints_share_check(self) -> None:
+		a, b = Below(10), Below(20)
+		self.assertIs(Var("x", "", [a, b])._check, Var("y", "", [a, b])._check)
+
+	def test_distinct_constraints_do_not_share_check(self) -> None:
+		a, b = Below(10), Below(20)
+		self.assertIsNot(Var("x", "", [a, b])._check, Var("y", "", [b, a])._check)
+		self.assertIsNot(Var("x", "", [a])._check, Var("y", "", [Below(10)])._check)
+
+	def test_equal_constraints_do_not_share_check(self) -> None:
+		va = Var("a", "", [Lt(5)])
+		vb = Var("b", "", [Lt(5)])
+		vb.constraints[0].n = 100
+		Binding(vb, 50)
+		with self.assertRaises(ValueError):
+			Binding(va, 50)
+
+	def test_shared_checks_are_bounded(self) -> None:
+		for i in range(variables._MAX_SHARED_CHECKS + 10):
+			Var("n", "d", [Below(i)])
+		self.assertLessEqual(len(variables._SHARED_CHECKS), variables._MAX_SHARED_CHECKS)
+
+
+class TestBindingRebind(unittest.TestCase):
+
+	def test_rebind_same_immutable_value_skips_check(self) -> None:
+		counting = Counting()
+		binding = Binding(Var("n", "d", [counting]), 1000)
+		binding.rebind(binding.value)
+		self.assertEqual(counting.calls, 1)
+
+	def test_rebind_after_constrain_revalidates(self) -> None:
+		var = Var("n", "d", [])
+		binding = Binding(var, 1000)
+		var.constrain([Below(10)])
+		with self.assertRaises(ValueError):
+			binding.rebind(binding.value)
+
+	def test_rebind_after_variable_change_revalidates(self) -> None:
+		binding = Binding(Var("a", "d", []), 1000)
+		binding.variable = Var("b", "d", [Below(10)])
+		with self.assertRaises(ValueError):
+			binding.rebind(binding.value)
+
+	def test_rebind_mutated_list_revalidates(self) -> None:
+		value = [1]
+		binding = Binding(Var("n", "d", [ShorterThan(2)]), value)
+		value.append(3)
+		with self.assertRaises(ValueError):
+			binding.rebind(value)
+
+	def test_rebind_frozenset_with_mutated_member_revalidates(self) -> None:
+		box = Box(1)
+		value = frozenset((box,))
+		binding = Binding(Var("n", "d", [BoxesBelow(10)]), value)
+		box.v = 100
+		with self.assertRaises(ValueError):
+			binding.rebind(value)
+
+
+if __name__ == "__main__":
+	unittest.main()